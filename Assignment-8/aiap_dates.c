@@ -0,0 +1,106 @@
+/*
+ * aiap_dates.c - optional C accelerator for Task5's convert_date_format.
+ *
+ * Converts "YYYY-MM-DD" to "DD-MM-YYYY" with the same validation as the
+ * pure-Python version, using fixed-offset byte parsing in the style of
+ * udatetime's RFC3339 parser: direct access to the ASCII buffer, digit
+ * arithmetic instead of int(), and a pre-sized output string.
+ *
+ * Build in place with:
+ *     python setup_aiap_dates.py build_ext --inplace
+ *
+ * Task5.py falls back to its pure-Python implementation when this module
+ * is not importable.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static const int days_common[12] = {31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
+static const int days_leap[12]   = {31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
+
+static PyObject *
+convert_date_format(PyObject *self, PyObject *arg)
+{
+    if (!PyUnicode_Check(arg)) {
+        PyErr_Format(PyExc_TypeError, "Date must be a string, got %s",
+                     Py_TYPE(arg)->tp_name);
+        return NULL;
+    }
+    /* Valid dates are 10 ASCII characters; anything wider cannot match. */
+    if (PyUnicode_GET_LENGTH(arg) != 10 ||
+        PyUnicode_KIND(arg) != PyUnicode_1BYTE_KIND) {
+        PyErr_Format(PyExc_ValueError,
+                     "Invalid date format. Expected 'YYYY-MM-DD', got '%U'", arg);
+        return NULL;
+    }
+
+    const Py_UCS1 *s = PyUnicode_1BYTE_DATA(arg);
+    if (s[4] != '-' || s[7] != '-') {
+        PyErr_Format(PyExc_ValueError,
+                     "Invalid date format. Expected 'YYYY-MM-DD', got '%U'", arg);
+        return NULL;
+    }
+    static const int digit_pos[8] = {0, 1, 2, 3, 5, 6, 8, 9};
+    for (int i = 0; i < 8; i++) {
+        Py_UCS1 c = s[digit_pos[i]];
+        if (c < '0' || c > '9') {
+            PyErr_Format(PyExc_ValueError,
+                         "Invalid date format. Expected 'YYYY-MM-DD', got '%U'",
+                         arg);
+            return NULL;
+        }
+    }
+
+    int year = (s[0] - '0') * 1000 + (s[1] - '0') * 100 +
+               (s[2] - '0') * 10 + (s[3] - '0');
+    int month = (s[5] - '0') * 10 + (s[6] - '0');
+    int day = (s[8] - '0') * 10 + (s[9] - '0');
+
+    if (month < 1 || month > 12) {
+        PyErr_Format(PyExc_ValueError,
+                     "Invalid month: %d. Month must be between 01 and 12", month);
+        return NULL;
+    }
+    if (year < 1) {
+        PyErr_Format(PyExc_ValueError,
+                     "Invalid year: %d. Year must be between 1 and 9999", year);
+        return NULL;
+    }
+    int is_leap = (year % 4 == 0 && year % 100 != 0) || (year % 400 == 0);
+    int max_day = (is_leap ? days_leap : days_common)[month - 1];
+    if (day < 1 || day > max_day) {
+        PyErr_Format(PyExc_ValueError,
+                     "Invalid day: %d. Day must be between 01 and %d for month %d",
+                     day, max_day, month);
+        return NULL;
+    }
+
+    PyObject *out = PyUnicode_New(10, 127);
+    if (out == NULL)
+        return NULL;
+    Py_UCS1 *o = PyUnicode_1BYTE_DATA(out);
+    o[0] = s[8]; o[1] = s[9]; o[2] = '-';
+    o[3] = s[5]; o[4] = s[6]; o[5] = '-';
+    o[6] = s[0]; o[7] = s[1]; o[8] = s[2]; o[9] = s[3];
+    return out;
+}
+
+static PyMethodDef aiap_dates_methods[] = {
+    {"convert_date_format", convert_date_format, METH_O,
+     "Convert a 'YYYY-MM-DD' string to 'DD-MM-YYYY', validating the date."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef aiap_dates_module = {
+    PyModuleDef_HEAD_INIT,
+    "aiap_dates",
+    "Fixed-format date conversion accelerator for Task5.",
+    -1,
+    aiap_dates_methods
+};
+
+PyMODINIT_FUNC
+PyInit_aiap_dates(void)
+{
+    return PyModule_Create(&aiap_dates_module);
+}
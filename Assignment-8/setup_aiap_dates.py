@@ -0,0 +1,15 @@
+"""Build script for the optional aiap_dates C accelerator used by Task5.
+
+Usage:
+    python setup_aiap_dates.py build_ext --inplace
+
+Task5.py works without the extension; it just runs its pure-Python
+converter instead.
+"""
+from setuptools import Extension, setup
+
+setup(
+    name="aiap_dates",
+    version="0.1",
+    ext_modules=[Extension("aiap_dates", sources=["aiap_dates.c"])],
+)
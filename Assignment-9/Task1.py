@@ -1,121 +1,219 @@
-from typing import List, Tuple
-import difflib
-
-
-def sum_even_odd(numbers: List[int]) -> Tuple[int, int]:
-	"""
-	Calculate the sums of even and odd integers in a list.
-
-	This function iterates over the provided list of integers and returns
-	two integers: the sum of all even numbers and the sum of all odd numbers.
-
-	Args:
-		numbers (List[int]): A list of integers to be summed. Non-integer
-			elements will raise a TypeError.
-
-	Returns:
-		Tuple[int, int]: A tuple where the first element is the sum of even
-			numbers and the second element is the sum of odd numbers.
-
-	Raises:
-		TypeError: If any element in `numbers` is not an int.
-
-	Examples:
-		>>> sum_even_odd([1, 2, 3, 4])
-		(6, 4)
-	"""
-	if not isinstance(numbers, list):
-		raise TypeError("numbers must be a list of integers")
-
-	sum_even = 0
-	sum_odd = 0
-	for i, v in enumerate(numbers):
-		if not isinstance(v, int):
-			raise TypeError(f"element at index {i} is not an int: {v!r}")
-		if v % 2 == 0:
-			sum_even += v
-		else:
-			sum_odd += v
-	return sum_even, sum_odd
-
-
-# --- AI-generated docstring (example produced by an AI-assisted tool) ---
-ai_docstring = '''
-Compute sums of even and odd numbers from a list.
-
-Given a list of numeric values, this function separates even and odd
-integers and returns two totals: the total of evens and the total of odds.
-The function expects integer inputs and will raise an error for other types.
-
-Parameters
-----------
-numbers : list
-	List of integers to evaluate.
-
-Returns
--------
-tuple
-	(sum_even, sum_odd) where sum_even is the sum of even integers and
-	sum_odd is the sum of odd integers.
-'''
-
-
-def compare_docstrings(manual: str, ai: str) -> None:
-	"""Print a brief comparison between two docstrings.
-
-	The comparison shows both docstrings, a simple length/word-count
-	summary, whether common sections (Args/Parameters/Returns) exist,
-	and a small line-by-line diff.
-	"""
-	print("--- Manual (Google-style) docstring ---")
-	print(manual.strip())
-	print()
-	print("--- AI-generated docstring ---")
-	print(ai.strip())
-	print()
-
-	# Basic metrics
-	def metrics(text: str):
-		words = text.split()
-		return len(text), len(words)
-
-	m_chars, m_words = metrics(manual)
-	a_chars, a_words = metrics(ai)
-	print(f"Manual: {m_chars} chars, {m_words} words")
-	print(f"AI:     {a_chars} chars, {a_words} words")
-	print()
-
-	# Check for common sections
-	def has_section(text: str, markers):
-		lower = text.lower()
-		return any(m.lower() in lower for m in markers)
-
-	print("Contains 'Args' or 'Parameters' section:",
-		  has_section(manual, ["Args:", "Parameters"]))
-	print("Contains 'Returns' section:", has_section(manual, ["Returns:", "Returns\n", "Returns:"]))
-	print("AI contains 'Args' or 'Parameters':", has_section(ai, ["Args:", "Parameters"]))
-	print("AI contains 'Returns' section:", has_section(ai, ["Returns:", "Returns\n"]))
-	print()
-
-	# Small line diff
-	manual_lines = manual.strip().splitlines()
-	ai_lines = ai.strip().splitlines()
-	diff = difflib.unified_diff(manual_lines, ai_lines, fromfile='manual', tofile='ai', lineterm='')
-	print('--- Short unified diff (manual -> ai) ---')
-	for i, line in enumerate(diff):
-		# limit output to first 40 lines of diff to keep output small
-		if i >= 40:
-			print('... (diff truncated)')
-			break
-		print(line)
-
-
-if __name__ == '__main__':
-	# Demo input and verification run
-	sample = [1, 2, 3, 4, 5, 6]
-	evens, odds = sum_even_odd(sample)
-	print(f"Sample: {sample}")
-	print(f"Sum of evens: {evens}, sum of odds: {odds}")
-	print()
-	# Compare the docstrings
-	compare_docstrings(sum_even_odd.__doc__ or "", ai_docstring)
+from typing import List, Tuple
+import difflib
+
+try:
+	import numpy as np
+except ImportError:
+	# NumPy is optional; without it the pure-Python loop handles all sizes.
+	np = None
+
+# Below this length the cost of converting to an ndarray outweighs the win.
+_NUMPY_MIN_LEN = 4096
+
+# Arrays at least this long are worth the threaded Numba kernel.
+_NUMBA_MIN_LEN = 100_000
+
+try:
+	from numba import njit, prange
+except ImportError:
+	# Numba is optional; large arrays then stay on the NumPy reductions.
+	njit = None
+
+if njit is not None:
+	@njit('UniTuple(int64, 2)(int64[::1])', parallel=True, cache=True)
+	def _sum_even_odd_nb(arr):
+		sum_even = 0
+		sum_odd = 0
+		for i in prange(arr.shape[0]):
+			v = arr[i]
+			if v & 1:
+				sum_odd += v
+			else:
+				sum_even += v
+		return sum_even, sum_odd
+else:
+	_sum_even_odd_nb = None
+
+
+def _sum_even_odd_np(numbers: List[int]):
+	"""NumPy fast path for sum_even_odd: one C-level reduction per sum.
+
+	Returns (sum_even, sum_odd), or None when the list is unsuitable for
+	int64 vectorization (non-int elements, bools, or values large enough
+	that the reduction could overflow) so the caller falls back to the
+	strict pure-Python loop.
+	"""
+	bound = 0
+	for v in numbers:
+		if type(v) is not int:
+			return None
+		if v > bound:
+			bound = v
+		elif -v > bound:
+			bound = -v
+	if bound * len(numbers) >= 2 ** 63:
+		return None
+	arr = np.fromiter(numbers, dtype=np.int64, count=len(numbers))
+	if _sum_even_odd_nb is not None and arr.shape[0] >= _NUMBA_MIN_LEN:
+		sum_even, sum_odd = _sum_even_odd_nb(arr)
+		return int(sum_even), int(sum_odd)
+	total = int(arr.sum(dtype=np.int64))
+	sum_odd = int(arr[(arr & 1) != 0].sum(dtype=np.int64))
+	return total - sum_odd, sum_odd
+
+
+def sum_even_odd(numbers: List[int]) -> Tuple[int, int]:
+	"""
+	Calculate the sums of even and odd integers in a list.
+
+	This function iterates over the provided list of integers and returns
+	two integers: the sum of all even numbers and the sum of all odd numbers.
+
+	Args:
+		numbers (List[int]): A list of integers to be summed. Non-integer
+			elements will raise a TypeError.
+
+	Returns:
+		Tuple[int, int]: A tuple where the first element is the sum of even
+			numbers and the second element is the sum of odd numbers.
+
+	Raises:
+		TypeError: If any element in `numbers` is not an int.
+
+	Examples:
+		>>> sum_even_odd([1, 2, 3, 4])
+		(6, 4)
+	"""
+	if not isinstance(numbers, list):
+		raise TypeError("numbers must be a list of integers")
+
+	if np is not None and len(numbers) >= _NUMPY_MIN_LEN:
+		result = _sum_even_odd_np(numbers)
+		if result is not None:
+			return result
+
+	# Validate in a dedicated pass so the arithmetic loop below runs free of
+	# per-element type checks. isinstance keeps the documented contract:
+	# anything that is an int — including bool and int subclasses — passes.
+	for i, v in enumerate(numbers):
+		if not isinstance(v, int):
+			raise TypeError(f"element at index {i} is not an int: {v!r}")
+
+	sum_even = 0
+	sum_odd = 0
+	for v in numbers:
+		# v & 1 tests parity on the low limb only, skipping the full
+		# arbitrary-precision __mod__ that v % 2 would run; the semantics
+		# match for negative ints as well.
+		if v & 1:
+			sum_odd += v
+		else:
+			sum_even += v
+	return sum_even, sum_odd
+
+
+def sum_even_odd_fast(numbers: List[int]) -> Tuple[int, int]:
+	"""
+	Unvalidated fast variant of sum_even_odd for callers that guarantee ints.
+
+	Both passes run inside the C-implemented builtin ``sum``: the odd total
+	comes from a generator filtered on ``v & 1`` and the even total is
+	derived by subtracting it from the overall sum, so no per-element
+	isinstance check or Python-level branching is paid.
+
+	Args:
+		numbers (List[int]): A list of plain integers. Elements are not
+			validated; non-int contents raise whatever ``sum`` raises.
+
+	Returns:
+		Tuple[int, int]: (sum_even, sum_odd), matching sum_even_odd.
+	"""
+	total = sum(numbers)
+	sum_odd = sum(v for v in numbers if v & 1)
+	return total - sum_odd, sum_odd
+
+
+# --- AI-generated docstring (example produced by an AI-assisted tool) ---
+ai_docstring = '''
+Compute sums of even and odd numbers from a list.
+
+Given a list of numeric values, this function separates even and odd
+integers and returns two totals: the total of evens and the total of odds.
+The function expects integer inputs and will raise an error for other types.
+
+Parameters
+----------
+numbers : list
+	List of integers to evaluate.
+
+Returns
+-------
+tuple
+	(sum_even, sum_odd) where sum_even is the sum of even integers and
+	sum_odd is the sum of odd integers.
+'''
+
+
+def _metrics(text: str):
+	"""Return (character count, word count) for a docstring."""
+	words = text.split()
+	return len(text), len(words)
+
+
+def _has_section(text: str, markers):
+	"""Check whether any of the given section markers appears in text."""
+	lower = text.lower()
+	return any(m.lower() in lower for m in markers)
+
+
+def compare_docstrings(manual: str, ai: str) -> None:
+	"""Print a brief comparison between two docstrings.
+
+	The comparison shows both docstrings, a simple length/word-count
+	summary, whether common sections (Args/Parameters/Returns) exist,
+	and a small line-by-line diff.
+	"""
+	print("--- Manual (Google-style) docstring ---")
+	print(manual.strip())
+	print()
+	print("--- AI-generated docstring ---")
+	print(ai.strip())
+	print()
+
+	# Basic metrics (module-level helper: no per-call closure creation)
+	m_chars, m_words = _metrics(manual)
+	a_chars, a_words = _metrics(ai)
+	print(f"Manual: {m_chars} chars, {m_words} words")
+	print(f"AI:     {a_chars} chars, {a_words} words")
+	print()
+
+	# Check for common sections
+	print("Contains 'Args' or 'Parameters' section:",
+		  _has_section(manual, ["Args:", "Parameters"]))
+	print("Contains 'Returns' section:", _has_section(manual, ["Returns:", "Returns\n", "Returns:"]))
+	print("AI contains 'Args' or 'Parameters':", _has_section(ai, ["Args:", "Parameters"]))
+	print("AI contains 'Returns' section:", _has_section(ai, ["Returns:", "Returns\n"]))
+	print()
+
+	# Small line diff
+	manual_lines = manual.strip().splitlines()
+	ai_lines = ai.strip().splitlines()
+	diff = difflib.unified_diff(manual_lines, ai_lines, fromfile='manual', tofile='ai', lineterm='')
+	print('--- Short unified diff (manual -> ai) ---')
+	for i, line in enumerate(diff):
+		# limit output to first 40 lines of diff to keep output small
+		if i >= 40:
+			print('... (diff truncated)')
+			break
+		print(line)
+
+
+if __name__ == '__main__':
+	# Demo input and verification run
+	sample = [1, 2, 3, 4, 5, 6]
+	evens, odds = sum_even_odd(sample)
+	print(f"Sample: {sample}")
+	print(f"Sum of evens: {evens}, sum of odds: {odds}")
+	print()
+	# Compare the docstrings
+	compare_docstrings(sum_even_odd.__doc__ or "", ai_docstring)
@@ -1,174 +1,339 @@
-"""task2.py
-
-Demonstrates an `sru_student` class with manual comments and a simulated
-AI-generated inline-comment version, then compares them.
-"""
-from typing import Any
-import difflib
-
-
-# MANUAL: Define the student class holding basic student info and fee state
-class sru_student:
-    # MANUAL: Initialize a student with name, roll number and hostel status
-    def __init__(self, name: str, roll_no: int, hostel_status: bool, fee_due: float = 0.0) -> None:
-        # MANUAL: store the student's name
-        self.name = name
-        # MANUAL: store the student's roll number
-        self.roll_no = roll_no
-        # MANUAL: boolean indicating whether student stays in hostel
-        self.hostel_status = hostel_status
-        # MANUAL: amount of fee currently due for the student
-        self.fee_due = float(fee_due)
-
-    # MANUAL: Update the fee (apply a payment or charge) and return the new due
-    def fee_update(self, amount: float) -> float:
-        # MANUAL: ensure amount is numeric
-        if not isinstance(amount, (int, float)):
-            # MANUAL: raise error on invalid input
-            raise TypeError("amount must be a number")
-        # MANUAL: apply the payment (positive amount reduces due, negative increases)
-        self.fee_due -= float(amount)
-        # MANUAL: return updated fee due
-        return self.fee_due
-
-    # MANUAL: Return a dictionary with student details for display or testing
-    def display_details(self) -> dict:
-        # MANUAL: prepare a details mapping
-        details = {
-            'name': self.name,
-            'roll_no': self.roll_no,
-            'hostel_status': self.hostel_status,
-            'fee_due': self.fee_due,
-        }
-        # MANUAL: return the mapping
-        return details
-
-
-# --- Simulated AI-generated inline comments version (as a single string) ---
-# AI: The AI tool was asked to add inline comments explaining each line/step.
-ai_commented_code = '''
-class sru_student:
-    # AI: Constructor: set up the student object with provided values
-    def __init__(self, name: str, roll_no: int, hostel_status: bool, fee_due: float = 0.0) -> None:
-        # AI: save name parameter on the instance
-        self.name = name
-        # AI: save roll number on the instance
-        self.roll_no = roll_no
-        # AI: save hostel residency status on the instance
-        self.hostel_status = hostel_status
-        # AI: convert fee_due to float and store it
-        self.fee_due = float(fee_due)
-
-    # AI: Adjust the fee_due by subtracting the given amount (payment)
-    def fee_update(self, amount: float) -> float:
-        # AI: validate that amount is int or float
-        if not isinstance(amount, (int, float)):
-            # AI: raise TypeError if invalid
-            raise TypeError("amount must be a number")
-        # AI: subtract amount from fee_due (payment reduces what is owed)
-        self.fee_due -= float(amount)
-        # AI: return the updated amount owed
-        return self.fee_due
-
-    # AI: Build and return a dict summarizing student information
-    def display_details(self) -> dict:
-        details = {
-            'name': self.name,
-            'roll_no': self.roll_no,
-            'hostel_status': self.hostel_status,
-            'fee_due': self.fee_due,
-        }
-        # AI: return the constructed dictionary
-        return details
-'''
-
-
-def compare_comments(manual_source: str, ai_source: str) -> None:
-    """Compare manual comments and AI-style comments and print a short diff.
-
-    The function prints both sources, simple counts, and a unified diff to
-    highlight differences in wording and structure between the manual and AI
-    inline comments.
-    """
-    print('--- Manual commented source (excerpt) ---')
-    print(manual_source.strip())
-    print()
-    print('--- AI commented source (excerpt) ---')
-    print(ai_source.strip())
-    print()
-
-    # Basic metrics
-    def metrics(text: str):
-        return len(text), len(text.split())
-
-    m_chars, m_words = metrics(manual_source)
-    a_chars, a_words = metrics(ai_source)
-    print(f'Manual: {m_chars} chars, {m_words} words')
-    print(f'AI:     {a_chars} chars, {a_words} words')
-    print()
-
-    # Produce a unified diff for visibility
-    manual_lines = manual_source.strip().splitlines()
-    ai_lines = ai_source.strip().splitlines()
-    diff = difflib.unified_diff(manual_lines, ai_lines, fromfile='manual', tofile='ai', lineterm='')
-    print('--- Unified diff (manual -> ai) ---')
-    for i, line in enumerate(diff):
-        if i >= 200:
-            print('... (diff truncated)')
-            break
-        print(line)
-
-
-if __name__ == '__main__':
-    # MANUAL: create a student instance for demonstration
-    student = sru_student('Alice', 101, True, fee_due=1500.0)
-    # MANUAL: show initial details
-    print('Initial details:', student.display_details())
-    # MANUAL: apply a payment of 500
-    new_due = student.fee_update(500)
-    # MANUAL: show updated due and details
-    print('After payment, fee_due =', new_due)
-    print('Updated details:', student.display_details())
-    print('\nNow comparing manual comments with AI-style comments:\n')
-
-    # Build a manual-source excerpt from this file's manual-commented lines
-    # For simplicity, we'll assemble the manual version from the class code above
-    manual_source = '''
-class sru_student:
-    # MANUAL: Initialize a student with name, roll number and hostel status
-    def __init__(self, name: str, roll_no: int, hostel_status: bool, fee_due: float = 0.0) -> None:
-        # MANUAL: store the student's name
-        self.name = name
-        # MANUAL: store the student's roll number
-        self.roll_no = roll_no
-        # MANUAL: boolean indicating whether student stays in hostel
-        self.hostel_status = hostel_status
-        # MANUAL: amount of fee currently due for the student
-        self.fee_due = float(fee_due)
-
-    # MANUAL: Update the fee (apply a payment or charge) and return the new due
-    def fee_update(self, amount: float) -> float:
-        # MANUAL: ensure amount is numeric
-        if not isinstance(amount, (int, float)):
-            # MANUAL: raise error on invalid input
-            raise TypeError("amount must be a number")
-        # MANUAL: apply the payment (positive amount reduces due, negative increases)
-        self.fee_due -= float(amount)
-        # MANUAL: return updated fee due
-        return self.fee_due
-
-    # MANUAL: Return a dictionary with student details for display or testing
-    def display_details(self) -> dict:
-        # MANUAL: prepare a details mapping
-        details = {
-            'name': self.name,
-            'roll_no': self.roll_no,
-            'hostel_status': self.hostel_status,
-            'fee_due': self.fee_due,
-        }
-        # MANUAL: return the mapping
-        return details
-'''
-
-    # Now compare the manual excerpt with the AI-commented version
-    compare_comments(manual_source, ai_commented_code)
+"""task2.py
+
+Demonstrates an `sru_student` class with manual comments and a simulated
+AI-generated inline-comment version, then compares them.
+"""
+from typing import Any
+import collections
+import difflib
+import itertools
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; word counts then come from the pure-Python path.
+    np = None
+
+# Below this size the encode + ndarray setup costs more than it saves.
+_NUMPY_MIN_CHARS = 4096
+
+# The ASCII whitespace bytes str.split treats as separators. The vectorized
+# counter only runs on all-ASCII text, where these six are the complete
+# separator set; Unicode whitespace (U+00A0, U+2028, ...) stays on the
+# scalar path, which matches str.split exactly.
+_WS_BYTES = tuple(b' \t\n\r\x0b\x0c')
+
+
+# MANUAL: Define the student class holding basic student info and fee state
+class sru_student:
+    # MANUAL: fixed slots keep attribute access at a known offset (no per-
+    # instance __dict__) and shrink each instance considerably when many
+    # students are held in memory
+    __slots__ = ('name', 'roll_no', 'hostel_status', 'fee_due', '_details_cache')
+
+    # MANUAL: Initialize a student with name, roll number and hostel status
+    def __init__(self, name: str, roll_no: int, hostel_status: bool, fee_due: float = 0.0) -> None:
+        # MANUAL: store the student's name
+        self.name = name
+        # MANUAL: store the student's roll number
+        self.roll_no = roll_no
+        # MANUAL: boolean indicating whether student stays in hostel
+        self.hostel_status = hostel_status
+        # MANUAL: amount of fee currently due for the student
+        self.fee_due = float(fee_due)
+        # MANUAL: memoized details dict, rebuilt lazily after fee changes
+        self._details_cache = None
+
+    # MANUAL: Update the fee (apply a payment or charge) and return the new due
+    def fee_update(self, amount: float) -> float:
+        # MANUAL: ensure amount is numeric; the exact-type test settles the
+        # common case without an MRO walk, and the isinstance fallback keeps
+        # int/float subclasses accepted (numeric strings stay rejected)
+        if type(amount) not in (int, float) and not isinstance(amount, (int, float)):
+            # MANUAL: raise error on invalid input
+            raise TypeError("amount must be a number")
+        # MANUAL: apply the payment (positive amount reduces due, negative increases)
+        self.fee_due -= float(amount)
+        # MANUAL: the cached details dict now shows a stale fee; drop it
+        self._details_cache = None
+        # MANUAL: return updated fee due
+        return self.fee_due
+
+    # MANUAL: Return a dictionary with student details for display or testing
+    def display_details(self) -> dict:
+        # MANUAL: reuse the memoized mapping when nothing has changed, so a
+        # display-heavy loop pays one dict build instead of one per call
+        details = self._details_cache
+        if details is None:
+            details = self._details_cache = {
+                'name': self.name,
+                'roll_no': self.roll_no,
+                'hostel_status': self.hostel_status,
+                'fee_due': self.fee_due,
+            }
+        # MANUAL: return the mapping
+        return details
+
+
+# Lightweight single-student view returned by StudentTable[__getitem__].
+StudentRow = collections.namedtuple('StudentRow', ('name', 'roll_no', 'hostel_status', 'fee_due'))
+
+
+class StudentTable:
+    """Column-oriented storage for bulk operations over many students.
+
+    Where sru_student keeps one Python object per student (and one
+    attribute lookup per field per student in any batch loop), this table
+    holds each field in a parallel NumPy array, so batch work like a
+    blanket fee update or a total-due sum runs as one vectorized pass over
+    contiguous memory. Requires NumPy; single students come back as
+    read-only StudentRow views via indexing.
+    """
+
+    __slots__ = ('name', 'roll_no', 'hostel_status', 'fee_due')
+
+    def __init__(self, n: int) -> None:
+        if np is None:
+            raise ImportError("StudentTable requires NumPy")
+        self.name = np.empty(n, dtype=object)
+        self.roll_no = np.zeros(n, dtype=np.int64)
+        self.hostel_status = np.zeros(n, dtype=bool)
+        self.fee_due = np.zeros(n, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.roll_no)
+
+    def __getitem__(self, i: int) -> 'StudentRow':
+        return StudentRow(self.name[i], int(self.roll_no[i]),
+                          bool(self.hostel_status[i]), float(self.fee_due[i]))
+
+    def fee_update_all(self, amount: float) -> None:
+        """Apply one payment/charge to every student in a single C pass."""
+        self.fee_due -= amount
+
+    def total_due(self) -> float:
+        """Sum of all outstanding fees via one vectorized reduction."""
+        return float(self.fee_due.sum())
+
+
+# --- Simulated AI-generated inline comments version (as a single string) ---
+# AI: The AI tool was asked to add inline comments explaining each line/step.
+ai_commented_code = '''
+class sru_student:
+    # AI: Constructor: set up the student object with provided values
+    def __init__(self, name: str, roll_no: int, hostel_status: bool, fee_due: float = 0.0) -> None:
+        # AI: save name parameter on the instance
+        self.name = name
+        # AI: save roll number on the instance
+        self.roll_no = roll_no
+        # AI: save hostel residency status on the instance
+        self.hostel_status = hostel_status
+        # AI: convert fee_due to float and store it
+        self.fee_due = float(fee_due)
+
+    # AI: Adjust the fee_due by subtracting the given amount (payment)
+    def fee_update(self, amount: float) -> float:
+        # AI: validate that amount is int or float
+        if not isinstance(amount, (int, float)):
+            # AI: raise TypeError if invalid
+            raise TypeError("amount must be a number")
+        # AI: subtract amount from fee_due (payment reduces what is owed)
+        self.fee_due -= float(amount)
+        # AI: return the updated amount owed
+        return self.fee_due
+
+    # AI: Build and return a dict summarizing student information
+    def display_details(self) -> dict:
+        details = {
+            'name': self.name,
+            'roll_no': self.roll_no,
+            'hostel_status': self.hostel_status,
+            'fee_due': self.fee_due,
+        }
+        # AI: return the constructed dictionary
+        return details
+'''
+
+
+# Split and measure the fixed AI source once at import; every call to
+# compare_comments against it then reuses these instead of re-running
+# strip/splitlines/split on the same large string.
+_AI_LINES = tuple(ai_commented_code.strip().splitlines())
+_AI_METRICS = (len(ai_commented_code), len(ai_commented_code.split()))
+
+
+def _wordcount(text: str) -> int:
+    """Count whitespace-separated words without building a throwaway list.
+
+    Large all-ASCII strings take a vectorized route: view the bytes as a
+    uint8 array, mask the whitespace bytes, and count the whitespace->word
+    transitions — one C compare per delimiter instead of a Python-level
+    split that allocates every word just to be counted. Text containing
+    non-ASCII characters uses the scalar loop, whose isspace() test covers
+    the full Unicode whitespace set like str.split does.
+    """
+    if np is not None and len(text) >= _NUMPY_MIN_CHARS and text.isascii():
+        buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        ws = buf == _WS_BYTES[0]
+        for byte in _WS_BYTES[1:]:
+            ws |= buf == byte
+        if ws.size == 0:
+            return 0
+        words = int(np.count_nonzero(ws[:-1] & ~ws[1:]))
+        if not ws[0]:
+            words += 1
+        return words
+    # Single fused pass for the small/NumPy-less case: track run starts
+    # instead of split()-ing, so no throwaway word list is allocated just
+    # to be len()'d.
+    words = 0
+    in_word = False
+    for ch in text:
+        if ch.isspace():
+            in_word = False
+        elif not in_word:
+            in_word = True
+            words += 1
+    return words
+
+
+def _metrics(text: str):
+    """Return (character count, word count) for a source string."""
+    return len(text), _wordcount(text)
+
+
+def compare_comments(manual_source: str, ai_source: str = ai_commented_code,
+                     ai_lines=_AI_LINES, ai_metrics=_AI_METRICS) -> None:
+    """Compare manual comments and AI-style comments and print a short diff.
+
+    The function prints both sources, simple counts, and a unified diff to
+    highlight differences in wording and structure between the manual and AI
+    inline comments. The AI side defaults to the module's pre-split lines
+    and pre-computed metrics; passing a different ai_source derives fresh
+    ones automatically (callers that already hold them can still pass
+    ai_lines/ai_metrics to skip the recomputation).
+    """
+    if ai_source is not ai_commented_code:
+        # A caller-supplied source must win over the module defaults.
+        if ai_lines is _AI_LINES:
+            ai_lines = tuple(ai_source.strip().splitlines())
+        if ai_metrics is _AI_METRICS:
+            ai_metrics = _metrics(ai_source)
+
+    # Strip once up front; both the display and the diff reuse the result.
+    manual_stripped = manual_source.strip()
+
+    print('--- Manual commented source (excerpt) ---')
+    print(manual_stripped)
+    print()
+    print('--- AI commented source (excerpt) ---')
+    print('\n'.join(ai_lines))
+    print()
+
+    # Basic metrics
+    m_chars, m_words = _metrics(manual_source)
+    a_chars, a_words = ai_metrics
+    print(f'Manual: {m_chars} chars, {m_words} words')
+    print(f'AI:     {a_chars} chars, {a_words} words')
+    print()
+
+    # Produce a unified diff for visibility
+    manual_lines = manual_stripped.splitlines()
+    diff = difflib.unified_diff(manual_lines, ai_lines, fromfile='manual', tofile='ai', lineterm='')
+    print('--- Unified diff (manual -> ai) ---')
+    # Take at most 201 lines (the 201st only proves truncation), then emit
+    # the whole block in one write instead of one locked/flushed print per
+    # diff line.
+    head = list(itertools.islice(diff, 201))
+    if len(head) > 200:
+        head[200] = '... (diff truncated)'
+    if head:
+        sys.stdout.write('\n'.join(head) + '\n')
+
+
+# Shared matcher for batch comparisons: SequenceMatcher indexes its second
+# sequence (b2j) on set_seq2, so keeping one instance and fixing the manual
+# side lets every comparison in a batch reuse that index. autojunk is off
+# because these sources are short and the popular-line heuristic only costs.
+_matcher = difflib.SequenceMatcher(autojunk=False)
+
+
+def compare_many(manual_source: str, ai_sources) -> list:
+    """Diff one manual source against many AI sources, reusing one matcher.
+
+    The manual side is installed once with set_seq2 so its line index is
+    built a single time; each AI source only pays set_seq1. Returns a list
+    of diff-line lists (one per AI source), formatted from the opcodes.
+    """
+    manual_lines = manual_source.strip().splitlines()
+    _matcher.set_seq2(manual_lines)
+    results = []
+    for ai_source in ai_sources:
+        ai_lines = ai_source.strip().splitlines()
+        _matcher.set_seq1(ai_lines)
+        out = []
+        for tag, i1, i2, j1, j2 in _matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            if tag in ('replace', 'insert'):
+                out.extend('- ' + line for line in manual_lines[j1:j2])
+            if tag in ('replace', 'delete'):
+                out.extend('+ ' + line for line in ai_lines[i1:i2])
+        results.append(out)
+    return results
+
+
+if __name__ == '__main__':
+    # MANUAL: create a student instance for demonstration
+    student = sru_student('Alice', 101, True, fee_due=1500.0)
+    # MANUAL: show initial details
+    print('Initial details:', student.display_details())
+    # MANUAL: apply a payment of 500
+    new_due = student.fee_update(500)
+    # MANUAL: show updated due and details
+    print('After payment, fee_due =', new_due)
+    print('Updated details:', student.display_details())
+    print('\nNow comparing manual comments with AI-style comments:\n')
+
+    # Build a manual-source excerpt from this file's manual-commented lines
+    # For simplicity, we'll assemble the manual version from the class code above
+    manual_source = '''
+class sru_student:
+    # MANUAL: Initialize a student with name, roll number and hostel status
+    def __init__(self, name: str, roll_no: int, hostel_status: bool, fee_due: float = 0.0) -> None:
+        # MANUAL: store the student's name
+        self.name = name
+        # MANUAL: store the student's roll number
+        self.roll_no = roll_no
+        # MANUAL: boolean indicating whether student stays in hostel
+        self.hostel_status = hostel_status
+        # MANUAL: amount of fee currently due for the student
+        self.fee_due = float(fee_due)
+
+    # MANUAL: Update the fee (apply a payment or charge) and return the new due
+    def fee_update(self, amount: float) -> float:
+        # MANUAL: ensure amount is numeric
+        if not isinstance(amount, (int, float)):
+            # MANUAL: raise error on invalid input
+            raise TypeError("amount must be a number")
+        # MANUAL: apply the payment (positive amount reduces due, negative increases)
+        self.fee_due -= float(amount)
+        # MANUAL: return updated fee due
+        return self.fee_due
+
+    # MANUAL: Return a dictionary with student details for display or testing
+    def display_details(self) -> dict:
+        # MANUAL: prepare a details mapping
+        details = {
+            'name': self.name,
+            'roll_no': self.roll_no,
+            'hostel_status': self.hostel_status,
+            'fee_due': self.fee_due,
+        }
+        # MANUAL: return the mapping
+        return details
+'''
+
+    # Now compare the manual excerpt with the AI-commented version
+    compare_comments(manual_source)
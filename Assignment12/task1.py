@@ -1,27 +1,71 @@
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; plain lists go through list.index either way.
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; ndarray searches then stay on the NumPy compare.
+    njit = None
+
+if njit is not None:
+    # The int64[::1] signature promises a C-contiguous array, which lets the
+    # compiled loop issue contiguous-stride loads that LLVM vectorizes. It
+    # also returns on the first hit, unlike the full-array NumPy compare.
+    @njit('int64(int64[::1], int64)', cache=True, boundscheck=False)
+    def linear_search_nb(arr, target):
+        for i in range(arr.shape[0]):
+            if arr[i] == target:
+                return i
+        return -1
+else:
+    linear_search_nb = None
+
+
 def linear_search(lst, target):
     """
     Performs linear search on a given list to find the index of the target value.
-    
+
     Parameters:
         lst (list): List of elements to search within.
         target (any): Value to find in the list.
-    
+
     Returns:
         int: Index of target if found, otherwise -1.
     """
-    for index in range(len(lst)):
-        if lst[index] == target:
-            return index  # Return the position where found
-    
-    return -1  # Return -1 if not found
+    if np is not None and isinstance(lst, np.ndarray):
+        # The target must already be integral: the eager int64 signature
+        # would silently truncate a float target (30.5 -> 30) at dispatch
+        # and blow up on non-numeric ones instead of returning -1.
+        if (linear_search_nb is not None and lst.dtype == np.int64
+                and lst.flags['C_CONTIGUOUS']
+                and isinstance(target, (int, np.integer))
+                and not isinstance(target, bool)):
+            return int(linear_search_nb(lst, target))
+        # Vectorized compare produces the whole hit mask in one C pass.
+        hits = np.flatnonzero(lst == target)
+        return int(hits[0]) if hits.size else -1
 
+    # list.index runs the same left-to-right scan entirely in C instead of
+    # paying bytecode dispatch per element.
+    try:
+        return lst.index(target)
+    except ValueError:
+        return -1  # Return -1 if not found
 
-# Example usage
-numbers = [10, 20, 30, 40, 50]
-value = 30
 
-result = linear_search(numbers, value)
-if result != -1:
-    print(f"Value {value} found at index {result}")
-else:
-    print("Value not found")
+__all__ = ['linear_search', 'linear_search_nb']
+
+
+if __name__ == "__main__":
+    # Example usage
+    numbers = [10, 20, 30, 40, 50]
+    value = 30
+
+    result = linear_search(numbers, value)
+    if result != -1:
+        print(f"Value {value} found at index {result}")
+    else:
+        print("Value not found")
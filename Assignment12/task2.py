@@ -1,31 +1,55 @@
-def bubble_sort(arr):
+def bubble_sort(arr, naive=False):
     """
-    Sorts a list using the Bubble Sort algorithm.
-    
+    Sorts a list and returns a new sorted list.
+
+    By default this delegates to the built-in Timsort (C-implemented,
+    O(n log n)); the original O(n^2) bubble sort is kept for reference
+    behind naive=True.
+
     Parameters:
         arr (list): The list of values to be sorted.
-    
+        naive (bool): Run the pedagogical bubble sort instead of sorted().
+
     Returns:
         list: A new sorted list.
     """
+    if not naive:
+        return sorted(arr)
+
     n = len(arr)
     sorted_arr = arr.copy()  # To avoid modifying the original list
 
+    a = sorted_arr  # Local alias: LOAD_FAST instead of repeated global-style lookup
     for i in range(n - 1):
+        swapped = False
         for j in range(0, n - i - 1):
-            if sorted_arr[j] > sorted_arr[j + 1]:
+            # Load each element once per comparison instead of re-indexing
+            # on both the test and the swap.
+            x = a[j]
+            y = a[j + 1]
+            if x > y:
                 # Swap elements
-                sorted_arr[j], sorted_arr[j + 1] = sorted_arr[j + 1], sorted_arr[j]
+                a[j] = y
+                a[j + 1] = x
+                swapped = True
+        if not swapped:
+            # No swaps in a full pass means the list is sorted; on
+            # nearly-sorted input this collapses the cost to about O(n).
+            break
 
     return sorted_arr
 
 
-# Example usage
-data = [5, 1, 4, 2, 8]
+__all__ = ['bubble_sort']
+
+
+if __name__ == "__main__":
+    # Example usage
+    data = [5, 1, 4, 2, 8]
 
-sorted_data = bubble_sort(data)
-print("Original List:", data)
-print("Sorted List:", sorted_data)
+    sorted_data = bubble_sort(data)
+    print("Original List:", data)
+    print("Sorted List:", sorted_data)
 
-# Checking whether sorted correctly
-print("Is sorted correctly?", sorted_data == sorted(data))
+    # Checking whether sorted correctly
+    print("Is sorted correctly?", sorted_data == sorted(data))
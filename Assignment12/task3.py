@@ -1,52 +1,76 @@
-"""
-Optimization problem:
-
-Let:
-  x = units of chocolate A
-  y = units of chocolate B
-
-Maximize profit:
-  Z = 6x + 5y
-
-Subject to resource constraints:
-  Milk:  1x + 1y <= 5
-  Choco: 3x + 2y <= 12
-  x, y >= 0
-"""
-
-import pulp
-
-
-def solve_chocolate_problem():
-    # Define the LP problem: maximize profit
-    problem = pulp.LpProblem("Chocolate_Profit_Maximization", pulp.LpMaximize)
-
-    # Decision variables (non‑negative and integer, since units are countable)
-    x = pulp.LpVariable("A_units", lowBound=0, cat="Integer")
-    y = pulp.LpVariable("B_units", lowBound=0, cat="Integer")
-
-    # Objective function: maximize 6x + 5y
-    problem += 6 * x + 5 * y, "Total_Profit"
-
-    # Constraints
-    problem += x + y <= 5, "Milk_Constraint"
-    problem += 3 * x + 2 * y <= 12, "Choco_Constraint"
-
-    # Solve the problem
-    problem.solve()
-
-    # Extract solution
-    optimal_x = int(pulp.value(x))
-    optimal_y = int(pulp.value(y))
-    max_profit = pulp.value(problem.objective)
-
-    return optimal_x, optimal_y, max_profit
-
-
-if __name__ == "__main__":
-    A_units, B_units, profit = solve_chocolate_problem()
-    print(f"Optimal units of A: {A_units}")
-    print(f"Optimal units of B: {B_units}")
-    print(f"Maximum profit: Rs {profit}")
-
-
+"""
+Optimization problem:
+
+Let:
+  x = units of chocolate A
+  y = units of chocolate B
+
+Maximize profit:
+  Z = 6x + 5y
+
+Subject to resource constraints:
+  Milk:  1x + 1y <= 5
+  Choco: 3x + 2y <= 12
+  x, y >= 0
+"""
+
+try:
+    import pulp
+except ImportError:
+    # PuLP is only needed for the use_solver=True path.
+    pulp = None
+
+
+def solve_chocolate_problem(use_solver=False):
+    """Return (units of A, units of B, max profit).
+
+    The feasible region is tiny (x + y <= 5 with integer x, y >= 0 leaves
+    about twenty points), so the default path simply enumerates it and
+    keeps the best profit — no solver subprocess to launch. The original
+    PuLP/CBC formulation is kept behind use_solver=True for reference.
+    """
+    if not use_solver:
+        best = (0, 0, 0)
+        for x in range(5):            # 3x <= 12 and x + y <= 5 cap x at 4
+            for y in range(6 - x):    # milk: x + y <= 5
+                if 3 * x + 2 * y <= 12:
+                    profit = 6 * x + 5 * y
+                    if profit > best[2]:
+                        best = (x, y, profit)
+        return best
+
+    if pulp is None:
+        raise ImportError("PuLP is required for use_solver=True")
+
+    # Define the LP problem: maximize profit
+    problem = pulp.LpProblem("Chocolate_Profit_Maximization", pulp.LpMaximize)
+
+    # Decision variables (non‑negative and integer, since units are countable)
+    x = pulp.LpVariable("A_units", lowBound=0, cat="Integer")
+    y = pulp.LpVariable("B_units", lowBound=0, cat="Integer")
+
+    # Objective function: maximize 6x + 5y
+    problem += 6 * x + 5 * y, "Total_Profit"
+
+    # Constraints
+    problem += x + y <= 5, "Milk_Constraint"
+    problem += 3 * x + 2 * y <= 12, "Choco_Constraint"
+
+    # Solve the problem
+    problem.solve()
+
+    # Extract solution
+    optimal_x = int(pulp.value(x))
+    optimal_y = int(pulp.value(y))
+    max_profit = pulp.value(problem.objective)
+
+    return optimal_x, optimal_y, max_profit
+
+
+if __name__ == "__main__":
+    A_units, B_units, profit = solve_chocolate_problem()
+    print(f"Optimal units of A: {A_units}")
+    print(f"Optimal units of B: {B_units}")
+    print(f"Maximum profit: Rs {profit}")
+
+
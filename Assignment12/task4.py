@@ -1,17 +1,48 @@
-def f(x):
-    return x**2 + 4*x + 5
-
-def df(x):
-    return 2*x + 4
-
-def gradient_descent(learning_rate=0.01, iterations=1000, initial_x=0.0):
-    x = initial_x
-    for i in range(iterations):
-        grad = df(x)
-        x = x - learning_rate * grad
-    return x
-
-if __name__ == "__main__":
-    min_x = gradient_descent(learning_rate=0.01, iterations=1000, initial_x=0.0)
-    print(f"Value of x where f(x) is minimum (approx): {min_x:.6f}")
-    print(f"Minimum value of f(x) (approx): {f(min_x):.6f}")
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; the pure-Python loop runs unchanged without it.
+    njit = None
+
+
+def f(x):
+    return x**2 + 4*x + 5
+
+def df(x):
+    return 2*x + 4
+
+def _gradient_descent_loop(learning_rate, iterations, initial_x):
+    x = initial_x
+    for i in range(iterations):
+        grad = df(x)
+        x = x - learning_rate * grad
+    return x
+
+if njit is not None:
+    # Explicit signatures force compilation at import; fastmath lets LLVM
+    # inline df and fuse the update into a single FMA recurrence.
+    f = njit('float64(float64)', cache=True, fastmath=True)(f)
+    df = njit('float64(float64)', cache=True, fastmath=True)(df)
+    _gradient_descent_loop = njit('float64(float64, int64, float64)',
+                                  cache=True, fastmath=True)(_gradient_descent_loop)
+
+def gradient_descent(learning_rate=0.01, iterations=1000, initial_x=0.0, exact=True):
+    """
+    Minimize f(x) = x**2 + 4x + 5 by gradient descent.
+
+    The update x <- x*(1 - 2*lr) - 4*lr is a linear recurrence whose N-th
+    iterate has the closed form (x0 + 2)*(1 - 2*lr)**N - 2, so the default
+    path answers in O(1) regardless of `iterations`. The closed form is
+    specific to this quadratic f; pass exact=False to run the iterative
+    loop instead.
+    """
+    if exact:
+        if learning_rate == 0:
+            return initial_x
+        return (initial_x + 2.0) * (1.0 - 2.0 * learning_rate) ** iterations - 2.0
+    return _gradient_descent_loop(learning_rate, iterations, initial_x)
+
+if __name__ == "__main__":
+    min_x = gradient_descent(learning_rate=0.01, iterations=1000, initial_x=0.0)
+    print(f"Value of x where f(x) is minimum (approx): {min_x:.6f}")
+    print(f"Minimum value of f(x) (approx): {f(min_x):.6f}")
@@ -1,10 +1,12 @@
 # Fibonacci Sequence with Positive Integer Validation
 
 def fibonacci(n):
-    sequence = []
+    # Pre-size the list so the loop only assigns by index instead of
+    # paying append's amortized reallocations as the list grows.
+    sequence = [0] * n
     a, b = 0, 1
-    for _ in range(n):
-        sequence.append(a)
+    for i in range(n):
+        sequence[i] = a
         a, b = b, a + b
     return sequence
 